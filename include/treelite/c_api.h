@@ -39,6 +39,8 @@ typedef void* TreeliteModelHandle;
 typedef void* TreeliteModelBuilderHandle;
 /*! \brief Handle to a configuration of GTIL predictor */
 typedef void* TreeliteGTILConfigHandle;
+/*! \brief Handle to a buffer allocated by Treelite */
+typedef void* TreeliteBufferHandle;
 /*! \} */
 
 /*!
@@ -47,7 +49,7 @@ typedef void* TreeliteGTILConfigHandle;
  */
 /*!
  * \brief Load a model file generated by XGBoost (dmlc/xgboost), stored in the legacy binary
- *        format.
+ *        format. The file is memory-mapped where supported.
  * \param filename Name of model file
  * \param config_json JSON string consisting key-value pairs; used for configuring the model parser
  * \param out Loaded model
@@ -68,6 +70,8 @@ TREELITE_DLL int TreeliteLoadXGBoostModelLegacyBinaryFromMemoryBuffer(
     void const* buf, size_t len, char const* config_json, TreeliteModelHandle* out);
 /*!
  * \brief Load a model file generated by XGBoost (dmlc/xgboost), stored in the JSON format.
+ *        The file is memory-mapped where supported. Set "prefetch": true in config_json to
+ *        read the whole file into memory up front, before parsing begins.
  * \param filename Name of model file
  * \param config_json Null-terminated JSON string consisting key-value pairs; used for configuring
  *                    the model parser
@@ -81,7 +85,8 @@ TREELITE_DLL int TreeliteLoadXGBoostModel(
  * \param json_str JSON string containing the XGBoost model
  * \param length Length of the JSON string
  * \param config_json Null-terminated JSON string consisting key-value pairs; used for configuring
- *                    the model parser
+ *                    the model parser. The "prefetch" key is rejected, since it only applies to
+ *                    files.
  * \param out Loaded model
  * \return 0 for success, -1 for failure
  */
@@ -519,6 +524,26 @@ TREELITE_DLL int TreeliteModelBuilderCommitModel(
  */
 TREELITE_DLL int TreeliteDumpAsJSON(
     TreeliteModelHandle handle, int pretty_print, char const** out_json_str);
+/*!
+ * \brief Dump a model object as a JSON string, into a newly allocated buffer. Unlike
+ *        \ref TreeliteDumpAsJSON, the caller owns the buffer and must free it with
+ *        \ref TreeliteFreeBuffer. The JSON is written into the buffer directly, without an
+ *        intermediate copy.
+ * \param handle The handle to the model object
+ * \param pretty_print Whether to pretty-print JSON string (0 for false, != 0 for true)
+ * \param out_handle Handle to the buffer, to be passed to \ref TreeliteFreeBuffer
+ * \param out_buf The JSON string. Valid until the buffer is freed.
+ * \param out_len Length of the JSON string, in bytes
+ * \return 0 for success, -1 for failure
+ */
+TREELITE_DLL int TreeliteDumpAsJSONToBuffer(TreeliteModelHandle handle, int pretty_print,
+    TreeliteBufferHandle* out_handle, char const** out_buf, size_t* out_len);
+/*!
+ * \brief Free a buffer allocated by Treelite, e.g. by \ref TreeliteDumpAsJSONToBuffer
+ * \param handle Handle to the buffer to free
+ * \return 0 for success, -1 for failure
+ */
+TREELITE_DLL int TreeliteFreeBuffer(TreeliteBufferHandle handle);
 /*!
  * \brief Query the input type of a Treelite model object
  * \param model Treelite Model object
@@ -547,6 +572,25 @@ TREELITE_DLL int TreeliteQueryNumTree(TreeliteModelHandle model, size_t* out);
  * \return 0 for success, -1 for failure
  */
 TREELITE_DLL int TreeliteQueryNumFeature(TreeliteModelHandle model, int* out);
+/*!
+ * \brief Get a read-only view of one of the node arrays of a tree, without copying. The view
+ *        remains valid until the model object is freed.
+ * \param model Model to query
+ * \param tree_id ID of the tree
+ * \param name Name of the field. One of: node_type, cleft, cright, split_index, default_left,
+ *             leaf_value, threshold, cmp, category_list_right_child, leaf_vector,
+ *             leaf_vector_begin, leaf_vector_end, category_list, category_list_begin,
+ *             category_list_end, data_count, data_count_present, sum_hess, sum_hess_present,
+ *             gain, gain_present
+ * \param out_buf Pointer to the beginning of the array
+ * \param out_format Format string of the array elements, as in the Python struct module
+ * \param out_itemsize Size of each array element, in bytes
+ * \param out_nitem Number of elements in the array
+ * \return 0 for success, -1 for failure
+ */
+TREELITE_DLL int TreeliteGetTreeField(TreeliteModelHandle model, uint64_t tree_id,
+    char const* name, void const** out_buf, char const** out_format, size_t* out_itemsize,
+    size_t* out_nitem);
 /*!
  * \brief Concatenate multiple model objects into a single model object by copying
  *        all member trees into the destination model object
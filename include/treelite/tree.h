@@ -368,6 +368,14 @@ class Tree {
    * \param gain Gain value
    */
   inline void SetGain(int nid, double gain);
+
+  /*!
+   * \brief Get a view of one of the node arrays (e.g. "threshold", "cleft"), without copying.
+   *        The view is valid as long as the tree is not modified or destroyed.
+   * \param name Name of the field
+   * \return Frame pointing to the beginning of the array
+   */
+  PyBufferFrame GetField(std::string const& name);
 };
 
 /*! \brief Typed portion of the model class */
@@ -452,11 +460,7 @@ class Model {
   }
   void DumpAsJSON(std::ostream& fo, bool pretty_print) const;
 
-  inline std::string DumpAsJSON(bool pretty_print) const {
-    std::ostringstream oss;
-    DumpAsJSON(oss, pretty_print);
-    return oss.str();
-  }
+  std::string DumpAsJSON(bool pretty_print) const;
 
   /* Compatibility Matrix:
      +------------------+----------+----------+----------------+-----------+
@@ -473,6 +477,15 @@ class Model {
   TREELITE_DLL_EXPORT static std::unique_ptr<Model> DeserializeFromPyBuffer(
       std::vector<PyBufferFrame> const& frames);
 
+  /*!
+   * \brief Get a view of one of the node arrays of a member tree, without copying.
+   *        See Tree::GetField() for the list of fields.
+   * \param tree_id ID of the tree
+   * \param name Name of the field
+   * \return Frame pointing to the beginning of the array
+   */
+  TREELITE_DLL_EXPORT PyBufferFrame GetTreeField(std::uint64_t tree_id, std::string const& name);
+
   /* Serialization to a file stream */
   void SerializeToStream(std::ostream& os);
   static std::unique_ptr<Model> DeserializeFromStream(std::istream& is);
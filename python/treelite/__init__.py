@@ -1,13 +1,16 @@
 """Treelite module"""
+import functools
+import importlib
 import pathlib
 
-from . import frontend, gtil, model_builder, sklearn
 from .core import TreeliteError
 from .model import Model
 
 VERSION_FILE = pathlib.Path(__file__).parent / "VERSION"
-with open(VERSION_FILE, "r", encoding="UTF-8") as _f:
-    __version__ = _f.read().strip()
+
+# Submodules are imported on first access, so that "import treelite" does not pay for
+# dependencies only needed by some of them (e.g. treelite.sklearn imports scikit-learn).
+_LAZY_SUBMODULES = frozenset(["frontend", "gtil", "sklearn", "model_builder"])
 
 __all__ = [
     "Model",
@@ -16,5 +19,32 @@ __all__ = [
     "sklearn",
     "model_builder",
     "TreeliteError",
-    "__version__",
+    "__version__",  # pylint: disable=undefined-all-variable
 ]
+
+
+@functools.lru_cache(maxsize=None)
+def _read_version() -> str:
+    try:
+        # Generated when the wheel is built
+        from ._version import __version__  # pylint: disable=import-outside-toplevel
+
+        return __version__
+    except ImportError:
+        # Running from the source tree
+        with open(VERSION_FILE, "r", encoding="UTF-8") as f:
+            return f.read().strip()
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        # import_module() also binds the submodule as an attribute of this package,
+        # so this function is only called once per submodule.
+        return importlib.import_module(f".{name}", __name__)
+    if name == "__version__":
+        return _read_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 """Compatibility layer to enable API migration"""
 import ctypes
 import json
+import os
 from typing import Any, Optional, Union
 
 from packaging.version import parse as parse_version
@@ -8,8 +9,25 @@ from packaging.version import parse as parse_version
 from .core import _LIB, TreeliteError, _check_call
 from .util import c_str
 
+# Parser configuration for loaders that take no options, encoded once at import
+_EMPTY_PARSER_CONFIG = c_str("{}")
+# Parser configurations for loading XGBoost JSON from a string, keyed by allow_unknown_field
+_XGBOOST_JSON_PARSER_CONFIG = {
+    allow_unknown_field: c_str(json.dumps({"allow_unknown_field": allow_unknown_field}))
+    for allow_unknown_field in (False, True)
+}
+# Parser configurations for loading XGBoost JSON from a file, keyed by
+# (allow_unknown_field, prefetch). Prefetching only applies to files.
+_XGBOOST_JSON_FILE_PARSER_CONFIG = {
+    (allow_unknown_field, prefetch): c_str(
+        json.dumps({"allow_unknown_field": allow_unknown_field, "prefetch": prefetch})
+    )
+    for allow_unknown_field in (False, True)
+    for prefetch in (False, True)
+}
+
 
-def load_xgboost_model_legacy_binary(filename: str) -> Any:
+def load_xgboost_model_legacy_binary(filename: Union[str, bytes, os.PathLike]) -> Any:
     """
     Load a tree ensemble model from XGBoost model, stored using
     the legacy binary format.
@@ -20,31 +38,38 @@ def load_xgboost_model_legacy_binary(filename: str) -> Any:
     handle = ctypes.c_void_p()
     _check_call(
         _LIB.TreeliteLoadXGBoostModelLegacyBinary(
-            c_str(filename), c_str("{}"), ctypes.byref(handle)
+            os.fsencode(filename), _EMPTY_PARSER_CONFIG, ctypes.byref(handle)
         )
     )
     return handle
 
 
-def load_xgboost_model(filename: str, *, allow_unknown_field: bool) -> Any:
+def load_xgboost_model(
+    filename: Union[str, bytes, os.PathLike],
+    *,
+    allow_unknown_field: bool,
+    prefetch: bool = False,
+) -> Any:
     """
     Load a tree ensemble model from XGBoost model, stored using the JSON format.
 
     TODO(hcho3): Move the implementation to treelite.frontend once
                  Model.load() is removed.
     """
-    parser_config = {"allow_unknown_field": allow_unknown_field}
-    parser_config_str = json.dumps(parser_config)
     handle = ctypes.c_void_p()
     _check_call(
         _LIB.TreeliteLoadXGBoostModel(
-            c_str(filename), c_str(parser_config_str), ctypes.byref(handle)
+            os.fsencode(filename),
+            _XGBOOST_JSON_FILE_PARSER_CONFIG[
+                (bool(allow_unknown_field), bool(prefetch))
+            ],
+            ctypes.byref(handle),
         )
     )
     return handle
 
 
-def load_lightgbm_model(filename: str) -> Any:
+def load_lightgbm_model(filename: Union[str, bytes, os.PathLike]) -> Any:
     """
     Load a tree ensemble model from a LightGBM model file
 
@@ -54,7 +79,7 @@ def load_lightgbm_model(filename: str) -> Any:
     handle = ctypes.c_void_p()
     _check_call(
         _LIB.TreeliteLoadLightGBMModel(
-            c_str(filename), c_str("{}"), ctypes.byref(handle)
+            os.fsencode(filename), _EMPTY_PARSER_CONFIG, ctypes.byref(handle)
         )
     )
     return handle
@@ -71,30 +96,25 @@ def from_xgboost_json(
     TODO(hcho3): Move the implementation to treelite.frontend once
                  Model.from_xgboost_json() is removed.
     """
-    parser_config = {"allow_unknown_field": allow_unknown_field}
-    parser_config_str = json.dumps(parser_config)
-
     handle = ctypes.c_void_p()
+    if isinstance(model_json_str, str):
+        model_json_str = model_json_str.encode("utf-8")
     length = len(model_json_str)
-    if isinstance(model_json_str, (bytes, bytearray)):
-        json_buffer = ctypes.create_string_buffer(bytes(model_json_str), length)
-        _check_call(
-            _LIB.TreeliteLoadXGBoostModelFromString(
-                json_buffer,
-                ctypes.c_size_t(length),
-                c_str(parser_config_str),
-                ctypes.byref(handle),
-            )
-        )
+    if isinstance(model_json_str, bytearray):
+        # Expose the underlying buffer directly, without copying
+        json_buffer = (ctypes.c_char * length).from_buffer(model_json_str)
     else:
-        _check_call(
-            _LIB.TreeliteLoadXGBoostModelFromString(
-                c_str(model_json_str),
-                ctypes.c_size_t(length),
-                c_str(parser_config_str),
-                ctypes.byref(handle),
-            )
+        # ctypes passes bytes objects to C functions as pointers to their internal
+        # buffer, so no copy is made here either
+        json_buffer = model_json_str
+    _check_call(
+        _LIB.TreeliteLoadXGBoostModelFromString(
+            json_buffer,
+            length,
+            _XGBOOST_JSON_PARSER_CONFIG[bool(allow_unknown_field)],
+            ctypes.byref(handle),
         )
+    )
     return handle
 
 
@@ -128,10 +148,9 @@ def from_xgboost(booster: Any) -> Any:
     handle = ctypes.c_void_p()
     buffer = booster.save_raw()
     ptr = (ctypes.c_char * len(buffer)).from_buffer(buffer)
-    length = ctypes.c_size_t(len(buffer))
     _check_call(
         _LIB.TreeliteLoadXGBoostModelLegacyBinaryFromMemoryBuffer(
-            ptr, length, ctypes.byref(handle)
+            ptr, len(buffer), _EMPTY_PARSER_CONFIG, ctypes.byref(handle)
         )
     )
     return handle
@@ -157,7 +176,7 @@ def from_lightgbm(booster: Any) -> Any:
     model_str = booster.model_to_string()
     _check_call(
         _LIB.TreeliteLoadLightGBMModelFromString(
-            c_str(model_str), c_str("{}"), ctypes.byref(handle)
+            c_str(model_str), _EMPTY_PARSER_CONFIG, ctypes.byref(handle)
         )
     )
     return handle
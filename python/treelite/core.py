@@ -24,6 +24,108 @@ def _warn_callback(msg: bytes) -> None:
     warnings.warn(py_str(msg))
 
 
+# Signatures of C API functions, in form of (argtypes, restype). Declaring them up front
+# spares ctypes from inferring the argument conversions on every call.
+_C_API_PROTOTYPES = {
+    "TreeliteLoadXGBoostModelLegacyBinary": (
+        [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteLoadXGBoostModelLegacyBinaryFromMemoryBuffer": (
+        [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_void_p),
+        ],
+        ctypes.c_int,
+    ),
+    "TreeliteLoadXGBoostModel": (
+        [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteLoadXGBoostModelFromString": (
+        [
+            ctypes.c_char_p,
+            ctypes.c_size_t,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_void_p),
+        ],
+        ctypes.c_int,
+    ),
+    "TreeliteLoadLightGBMModel": (
+        [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteLoadLightGBMModelFromString": (
+        [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteDumpAsJSON": (
+        [ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteDumpAsJSONToBuffer": (
+        [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.POINTER(ctypes.c_size_t),
+        ],
+        ctypes.c_int,
+    ),
+    "TreeliteFreeBuffer": ([ctypes.c_void_p], ctypes.c_int),
+    "TreeliteGetInputType": (
+        [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteGetOutputType": (
+        [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char_p)],
+        ctypes.c_int,
+    ),
+    "TreeliteQueryNumTree": (
+        [ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t)],
+        ctypes.c_int,
+    ),
+    "TreeliteQueryNumFeature": (
+        [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)],
+        ctypes.c_int,
+    ),
+    "TreeliteGetTreeField": (
+        [
+            ctypes.c_void_p,
+            ctypes.c_uint64,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_void_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_size_t),
+            ctypes.POINTER(ctypes.c_size_t),
+        ],
+        ctypes.c_int,
+    ),
+    "TreeliteFreeModel": ([ctypes.c_void_p], ctypes.c_int),
+}
+
+
+def _configure_prototypes(lib) -> None:
+    """Declare argument and return types for C API functions"""
+    for name, (argtypes, restype) in _C_API_PROTOTYPES.items():
+        func = getattr(lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
+
+
+def _register_callbacks(lib) -> None:
+    """Register the Python log and warning callbacks with the native library.
+    The native library keeps the callbacks in thread-local storage, so this must be
+    called on every thread that calls into the library."""
+    if lib.TreeliteRegisterLogCallback(lib.log_callback) != 0:
+        raise TreeliteError(py_str(lib.TreeliteGetLastError()))
+    if lib.TreeliteRegisterWarningCallback(lib.warn_callback) != 0:
+        raise TreeliteError(py_str(lib.TreeliteGetLastError()))
+
+
 def _load_lib():
     """Load Treelite Library."""
     lib_path = [str(x) for x in find_lib_path()]
@@ -37,12 +139,10 @@ def _load_lib():
         )
     lib = ctypes.cdll.LoadLibrary(lib_path[0])
     lib.TreeliteGetLastError.restype = ctypes.c_char_p
+    _configure_prototypes(lib)
     lib.log_callback = _log_callback
     lib.warn_callback = _warn_callback
-    if lib.TreeliteRegisterLogCallback(lib.log_callback) != 0:
-        raise TreeliteError(py_str(lib.TreeliteGetLastError()))
-    if lib.TreeliteRegisterWarningCallback(lib.warn_callback) != 0:
-        raise TreeliteError(py_str(lib.TreeliteGetLastError()))
+    _register_callbacks(lib)
     return lib
 
 
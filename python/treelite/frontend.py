@@ -1,14 +1,16 @@
 """Functions to load and build model objects"""
 from __future__ import annotations
 
-import pathlib
-from typing import Any, Union
+import concurrent.futures
+import os
+from typing import Any, List, Sequence, Union
 
 from . import compat
+from .core import _LIB, _register_callbacks
 from .model import Model
 
 
-def load_xgboost_model_legacy_binary(filename: Union[str, pathlib.Path]) -> Model:
+def load_xgboost_model_legacy_binary(filename: Union[str, bytes, os.PathLike]) -> Model:
     """
     Load a tree ensemble model from XGBoost model, stored using
     the legacy binary format. Note: new XGBoost models should
@@ -33,11 +35,14 @@ def load_xgboost_model_legacy_binary(filename: Union[str, pathlib.Path]) -> Mode
        xgb_model = treelite.frontend.load_xgboost_model_legacy_binary(
            "xgboost_model.model")
     """
-    return Model(handle=compat.load_xgboost_model_legacy_binary(str(filename)))
+    return Model(handle=compat.load_xgboost_model_legacy_binary(filename))
 
 
 def load_xgboost_model(
-    filename: Union[str, pathlib.Path], *, allow_unknown_field: bool = False
+    filename: Union[str, bytes, os.PathLike],
+    *,
+    allow_unknown_field: bool = False,
+    prefetch: bool = False,
 ) -> Model:
     """
     Load a tree ensemble model from XGBoost model, stored using the JSON format.
@@ -48,6 +53,10 @@ def load_xgboost_model(
         Path to model file
     allow_unknown_field:
         Whether to allow extra fields with unrecognized keys
+    prefetch:
+        Whether to read the whole file into memory before parsing begins, instead of
+        reading it page by page as the parser advances. This can speed up loading
+        large models from slow storage.
 
     Returns
     -------
@@ -63,12 +72,66 @@ def load_xgboost_model(
     """
     return Model(
         handle=compat.load_xgboost_model(
-            str(filename), allow_unknown_field=allow_unknown_field
+            filename, allow_unknown_field=allow_unknown_field, prefetch=prefetch
         )
     )
 
 
-def load_lightgbm_model(filename: Union[str, pathlib.Path]) -> Model:
+def load_xgboost_models(
+    filenames: Sequence[Union[str, bytes, os.PathLike]],
+    *,
+    allow_unknown_field: bool = False,
+    prefetch: bool = False,
+    nthread: int = -1,
+) -> List[Model]:
+    """
+    Load multiple tree ensemble models from XGBoost model files, stored using the JSON
+    format. The files are loaded concurrently, using a pool of threads.
+
+    Parameters
+    ----------
+    filenames :
+        Paths to model files
+    allow_unknown_field:
+        Whether to allow extra fields with unrecognized keys
+    prefetch:
+        Whether to read each file into memory before parsing begins. See
+        :py:func:`load_xgboost_model`.
+    nthread :
+        Number of threads to use. If <= 0, use as many threads as there are CPU cores.
+
+    Returns
+    -------
+    models :
+        Loaded models, in the same order as ``filenames``
+
+    Example
+    -------
+
+    .. code-block:: python
+
+       xgb_models = treelite.frontend.load_xgboost_models(
+           [f"fold{i}.json" for i in range(5)])
+    """
+    if nthread <= 0:
+        nthread = os.cpu_count() or 1
+    # The native library is called with the GIL released, so the files are parsed in parallel.
+    # Register the log and warning callbacks on every worker thread, since the native library
+    # keeps them in thread-local storage.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=nthread, initializer=_register_callbacks, initargs=(_LIB,)
+    ) as executor:
+        return list(
+            executor.map(
+                lambda filename: load_xgboost_model(
+                    filename, allow_unknown_field=allow_unknown_field, prefetch=prefetch
+                ),
+                filenames,
+            )
+        )
+
+
+def load_lightgbm_model(filename: Union[str, bytes, os.PathLike]) -> Model:
     """
     Load a tree ensemble model from a LightGBM model file.
 
@@ -89,7 +152,7 @@ def load_lightgbm_model(filename: Union[str, pathlib.Path]) -> Model:
 
        lgb_model = treelite.frontend.load_lightgbm_model("lightgbm_model.txt")
     """
-    return Model(handle=compat.load_lightgbm_model(str(filename)))
+    return Model(handle=compat.load_lightgbm_model(filename))
 
 
 def from_xgboost(booster: Any) -> Model:
@@ -156,6 +219,7 @@ def from_lightgbm(booster: Any) -> Model:
 __all__ = [
     "load_xgboost_model_legacy_binary",
     "load_xgboost_model",
+    "load_xgboost_models",
     "load_lightgbm_model",
     "from_xgboost",
     "from_xgboost_json",
@@ -151,8 +151,10 @@ def _predict_impl(model: Model, data: np.ndarray, *, config: GTILConfig) -> np.n
     if (not isinstance(data, np.ndarray)) or len(data.shape) != 2:
         raise ValueError('Argument "data" must be a 2D NumPy array')
 
+    input_type = model.input_type
+    output_type = model.output_type
     data = np.array(
-        data, copy=False, dtype=typestr_to_numpy_type(model.input_type), order="C"
+        data, copy=False, dtype=typestr_to_numpy_type(input_type), order="C"
     )
     output_shape_ptr = ctypes.POINTER(ctypes.c_uint64)()
     output_ndim = ctypes.c_uint64()
@@ -168,18 +170,16 @@ def _predict_impl(model: Model, data: np.ndarray, *, config: GTILConfig) -> np.n
     output_shape = np.ctypeslib.as_array(output_shape_ptr, shape=(output_ndim.value,))
 
     out_result = np.zeros(
-        shape=output_shape, dtype=typestr_to_numpy_type(model.output_type), order="C"
+        shape=output_shape, dtype=typestr_to_numpy_type(output_type), order="C"
     )
     _check_call(
         _LIB.TreeliteGTILPredict(
             model.handle,
-            data.ctypes.data_as(
-                ctypes.POINTER(typestr_to_ctypes_type(model.input_type))
-            ),
-            c_str(model.input_type),
+            data.ctypes.data_as(ctypes.POINTER(typestr_to_ctypes_type(input_type))),
+            c_str(input_type),
             ctypes.c_size_t(data.shape[0]),
             out_result.ctypes.data_as(
-                ctypes.POINTER(typestr_to_ctypes_type(model.output_type))
+                ctypes.POINTER(typestr_to_ctypes_type(output_type))
             ),
             config.handle,
         )
@@ -3,14 +3,39 @@
 from __future__ import annotations
 
 import ctypes
+import functools
 import pathlib
 import warnings
-from typing import Any, List, Optional, Union
+import weakref
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 
 from . import compat
 from .core import _LIB, _check_call
 from .util import c_array, c_str, py_str
 
+# Map the last character of a struct format string to the kind of a NumPy dtype
+_FORMAT_TO_DTYPE_KIND = {
+    "?": "b",
+    "b": "i",
+    "h": "i",
+    "l": "i",
+    "q": "i",
+    "B": "u",
+    "H": "u",
+    "L": "u",
+    "Q": "u",
+    "f": "f",
+    "d": "f",
+}
+
+
+def _free_model_handle(handle: Any) -> None:
+    """Free the C++ model object. ctypes releases the GIL for the duration of the call."""
+    if _LIB is not None:
+        _check_call(_LIB.TreeliteFreeModel(handle))
+
 
 class Model:
     """
@@ -24,18 +49,21 @@ class Model:
 
     def __init__(self, *, handle: Optional[Any] = None):
         self._handle = handle
-
-    def __del__(self):
-        if self.handle is not None:
-            _check_call(_LIB.TreeliteFreeModel(self._handle))
-            self._handle = None
+        # Output of dump_as_json_bytes(), keyed by the value of pretty_print
+        self._json_cache: Dict[bool, bytes] = {}
+        if handle is not None:
+            # Unlike __del__, the finalizer does not run on a partially constructed
+            # object, and it runs before module globals are torn down at exit.
+            weakref.finalize(self, _free_model_handle, handle)
 
     @property
     def handle(self):
         """Access the handle to the associated C++ object"""
         return self._handle
 
-    @property
+    # Model metadata is immutable once the model is loaded, so each query below is
+    # made at most once per model object and then cached.
+    @functools.cached_property
     def num_tree(self) -> int:
         """Number of decision trees in the model"""
         if self.handle is None:
@@ -44,16 +72,16 @@ class Model:
         _check_call(_LIB.TreeliteQueryNumTree(self.handle, ctypes.byref(out)))
         return out.value
 
-    @property
+    @functools.cached_property
     def num_feature(self) -> int:
         """Number of features used in the model"""
         if self.handle is None:
             raise AttributeError("Model not loaded yet")
-        out = ctypes.c_size_t()
+        out = ctypes.c_int()
         _check_call(_LIB.TreeliteQueryNumFeature(self.handle, ctypes.byref(out)))
         return out.value
 
-    @property
+    @functools.cached_property
     def input_type(self) -> str:
         """Input type"""
         if self.handle is None:
@@ -62,7 +90,7 @@ class Model:
         _check_call(_LIB.TreeliteGetInputType(self.handle, ctypes.byref(out)))
         return py_str(out.value)
 
-    @property
+    @functools.cached_property
     def output_type(self) -> str:
         """Output type"""
         if self.handle is None:
@@ -71,6 +99,60 @@ class Model:
         _check_call(_LIB.TreeliteGetOutputType(self.handle, ctypes.byref(out)))
         return py_str(out.value)
 
+    def get_tree_field(self, tree_id: int, name: str) -> np.ndarray:
+        """
+        Get one of the node arrays of a tree, e.g. ``threshold`` or ``cleft``, as a
+        read-only NumPy array. The array is a view into the memory of the model object,
+        so no data is copied.
+
+        Parameters
+        ----------
+        tree_id :
+            ID of the tree
+        name :
+            Name of the field. One of ``node_type``, ``cleft``, ``cright``,
+            ``split_index``, ``default_left``, ``leaf_value``, ``threshold``, ``cmp``,
+            ``category_list_right_child``, ``leaf_vector``, ``leaf_vector_begin``,
+            ``leaf_vector_end``, ``category_list``, ``category_list_begin``,
+            ``category_list_end``, ``data_count``, ``data_count_present``,
+            ``sum_hess``, ``sum_hess_present``, ``gain``, ``gain_present``
+
+        Returns
+        -------
+        field : :py:class:`numpy.ndarray`
+            Read-only view of the field. It keeps the model object alive.
+        """
+        if self.handle is None:
+            raise AttributeError("Model not loaded yet")
+        buf = ctypes.c_void_p()
+        fmt = ctypes.c_char_p()
+        itemsize = ctypes.c_size_t()
+        nitem = ctypes.c_size_t()
+        _check_call(
+            _LIB.TreeliteGetTreeField(
+                self.handle,
+                ctypes.c_uint64(tree_id),
+                c_str(name),
+                ctypes.byref(buf),
+                ctypes.byref(fmt),
+                ctypes.byref(itemsize),
+                ctypes.byref(nitem),
+            )
+        )
+        dtype = np.dtype(
+            f"{_FORMAT_TO_DTYPE_KIND[py_str(fmt.value)[-1]]}{itemsize.value}"
+        )
+        if nitem.value == 0:
+            field = np.empty(0, dtype=dtype)
+        else:
+            raw = (ctypes.c_char * (itemsize.value * nitem.value)).from_address(
+                buf.value
+            )
+            raw.model = self  # Keep the model alive for as long as the view is in use
+            field = np.frombuffer(raw, dtype=dtype)
+        field.flags.writeable = False
+        return field
+
     @classmethod
     def concatenate(cls, model_objs: List[Model]) -> Model:
         """
@@ -254,16 +336,52 @@ class Model:
         -------
         json_str :
             JSON string representing the model
+
+        Notes
+        -----
+        For large models, prefer :py:meth:`dump_as_json_bytes`, which skips decoding the
+        JSON string into a Python ``str``. :py:func:`json.loads` accepts ``bytes`` too.
         """
-        json_str = ctypes.c_char_p()
-        _check_call(
-            _LIB.TreeliteDumpAsJSON(
-                self.handle,
-                ctypes.c_int(1 if pretty_print else 0),
-                ctypes.byref(json_str),
+        return py_str(self.dump_as_json_bytes(pretty_print=pretty_print))
+
+    def dump_as_json_bytes(self, *, pretty_print: bool = True) -> bytes:
+        """
+        Dump the model as a JSON string, encoded in UTF-8.
+
+        Parameters
+        ----------
+        pretty_print :
+            Whether to pretty-print the JSON string, set this to False to make the string compact
+
+        Returns
+        -------
+        json_bytes :
+            JSON string representing the model, as UTF-8 bytes
+
+        Notes
+        -----
+        The JSON string is generated once per value of ``pretty_print`` and cached in the
+        model object, so repeated calls do not re-serialize the model.
+        """
+        pretty_print = bool(pretty_print)
+        if pretty_print not in self._json_cache:
+            buf_handle = ctypes.c_void_p()
+            buf = ctypes.c_void_p()
+            length = ctypes.c_size_t()
+            _check_call(
+                _LIB.TreeliteDumpAsJSONToBuffer(
+                    self.handle,
+                    ctypes.c_int(1 if pretty_print else 0),
+                    ctypes.byref(buf_handle),
+                    ctypes.byref(buf),
+                    ctypes.byref(length),
+                )
             )
-        )
-        return py_str(json_str.value)
+            try:
+                self._json_cache[pretty_print] = ctypes.string_at(buf, length.value)
+            finally:
+                _check_call(_LIB.TreeliteFreeBuffer(buf_handle))
+        return self._json_cache[pretty_print]
 
     def serialize(self, filename: Union[str, pathlib.Path]) -> None:
         """
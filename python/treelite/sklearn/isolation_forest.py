@@ -10,24 +10,32 @@ def harmonic(number):
 
 
 def expected_depth(n_remainder):
-    """Calculates the expected isolation depth for a remainder of uniform points"""
-    if n_remainder <= 1:
-        return 0.0
-    if n_remainder == 2:
-        return 1.0
-    return float(2 * (harmonic(n_remainder) - 1))
+    """Calculates the expected isolation depth for a remainder of uniform points.
+    Accepts a scalar or an array of remainders"""
+    n_remainder = np.asarray(n_remainder)
+    depth = np.where(
+        n_remainder <= 1,
+        0.0,
+        np.where(n_remainder == 2, 1.0, 2 * (harmonic(n_remainder) - 1)),
+    )
+    return float(depth) if depth.ndim == 0 else depth
 
 
 def calculate_depths(isolation_depths, tree, curr_node, curr_depth):
     """Fill in an array of isolation depths for a scikit-learn isolation forest model"""
-    if tree.children_left[curr_node] == -1:
-        isolation_depths[curr_node] = curr_depth + expected_depth(
-            tree.n_node_samples[curr_node]
-        )
-    else:
-        calculate_depths(
-            isolation_depths, tree, tree.children_left[curr_node], curr_depth + 1
-        )
-        calculate_depths(
-            isolation_depths, tree, tree.children_right[curr_node], curr_depth + 1
+    # Visit the tree one level at a time, so that the number of Python-level iterations
+    # is the depth of the tree rather than the number of nodes
+    children_left = tree.children_left
+    children_right = tree.children_right
+    node_depth = np.zeros(children_left.shape[0], dtype=np.float64)
+    node_depth[curr_node] = curr_depth
+    frontier = np.array([curr_node], dtype=np.intp)
+    while frontier.size > 0:
+        is_leaf = children_left[frontier] == -1
+        leaves = frontier[is_leaf]
+        isolation_depths[leaves] = node_depth[leaves] + expected_depth(
+            tree.n_node_samples[leaves]
         )
+        parents = frontier[~is_leaf]
+        frontier = np.concatenate((children_left[parents], children_right[parents]))
+        node_depth[frontier] = np.tile(node_depth[parents] + 1, 2)
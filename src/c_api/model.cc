@@ -11,6 +11,8 @@
 
 #include <algorithm>
 #include <cstddef>
+#include <cstdint>
+#include <memory>
 #include <string>
 
 #include "./c_api_utils.h"
@@ -24,6 +26,25 @@ int TreeliteDumpAsJSON(TreeliteModelHandle handle, int pretty_print, char const*
   API_END();
 }
 
+int TreeliteDumpAsJSONToBuffer(TreeliteModelHandle handle, int pretty_print,
+    TreeliteBufferHandle* out_handle, char const** out_buf, std::size_t* out_len) {
+  API_BEGIN();
+  auto* model_ = static_cast<treelite::Model*>(handle);
+  // The serializer writes into the string directly, and the string is moved to the heap, so the
+  // JSON is never copied. The caller frees the string with TreeliteFreeBuffer().
+  auto json_str = std::make_unique<std::string>(model_->DumpAsJSON(pretty_print != 0));
+  *out_buf = json_str->data();
+  *out_len = json_str->length();
+  *out_handle = static_cast<TreeliteBufferHandle>(json_str.release());
+  API_END();
+}
+
+int TreeliteFreeBuffer(TreeliteBufferHandle handle) {
+  API_BEGIN();
+  delete static_cast<std::string*>(handle);
+  API_END();
+}
+
 int TreeliteGetInputType(TreeliteModelHandle model, char const** out_str) {
   API_BEGIN();
   auto const* model_ = static_cast<treelite::Model const*>(model);
@@ -56,6 +77,19 @@ int TreeliteQueryNumFeature(TreeliteModelHandle model, int* out) {
   API_END();
 }
 
+int TreeliteGetTreeField(TreeliteModelHandle model, uint64_t tree_id, char const* name,
+    void const** out_buf, char const** out_format, std::size_t* out_itemsize,
+    std::size_t* out_nitem) {
+  API_BEGIN();
+  auto* model_ = static_cast<treelite::Model*>(model);
+  treelite::PyBufferFrame frame = model_->GetTreeField(tree_id, name);
+  *out_buf = frame.buf;
+  *out_format = frame.format;
+  *out_itemsize = frame.itemsize;
+  *out_nitem = frame.nitem;
+  API_END();
+}
+
 int TreeliteConcatenateModelObjects(
     TreeliteModelHandle const* objs, std::size_t len, TreeliteModelHandle* out) {
   API_BEGIN();
@@ -0,0 +1,97 @@
+/*!
+ * Copyright (c) 2023 by Contributors
+ * \file field_accessor.cc
+ * \brief Zero-copy access to the node arrays of decision trees
+ * \author Hyunsu Cho
+ */
+
+#include <treelite/detail/serializer.h>
+#include <treelite/logging.h>
+#include <treelite/pybuffer_frame.h>
+#include <treelite/tree.h>
+
+#include <cstdint>
+#include <string>
+#include <variant>
+
+namespace {
+
+template <typename T>
+treelite::PyBufferFrame GetFrame(treelite::ContiguousArray<T>& field) {
+  return treelite::detail::serializer::GetPyBufferFromArray(&field);
+}
+
+treelite::PyBufferFrame GetFrame(treelite::ContiguousArray<bool>& field) {
+  // Use the format string for C99 _Bool, so that consumers can tell boolean arrays apart from
+  // arrays of unsigned bytes
+  return treelite::detail::serializer::GetPyBufferFromArray(&field, "=?");
+}
+
+}  // anonymous namespace
+
+namespace treelite {
+
+template <typename ThresholdType, typename LeafOutputType>
+PyBufferFrame Tree<ThresholdType, LeafOutputType>::GetField(std::string const& name) {
+  if (name == "node_type") {
+    return GetFrame(node_type_);
+  } else if (name == "cleft") {
+    return GetFrame(cleft_);
+  } else if (name == "cright") {
+    return GetFrame(cright_);
+  } else if (name == "split_index") {
+    return GetFrame(split_index_);
+  } else if (name == "default_left") {
+    return GetFrame(default_left_);
+  } else if (name == "leaf_value") {
+    return GetFrame(leaf_value_);
+  } else if (name == "threshold") {
+    return GetFrame(threshold_);
+  } else if (name == "cmp") {
+    return GetFrame(cmp_);
+  } else if (name == "category_list_right_child") {
+    return GetFrame(category_list_right_child_);
+  } else if (name == "leaf_vector") {
+    return GetFrame(leaf_vector_);
+  } else if (name == "leaf_vector_begin") {
+    return GetFrame(leaf_vector_begin_);
+  } else if (name == "leaf_vector_end") {
+    return GetFrame(leaf_vector_end_);
+  } else if (name == "category_list") {
+    return GetFrame(category_list_);
+  } else if (name == "category_list_begin") {
+    return GetFrame(category_list_begin_);
+  } else if (name == "category_list_end") {
+    return GetFrame(category_list_end_);
+  } else if (name == "data_count") {
+    return GetFrame(data_count_);
+  } else if (name == "data_count_present") {
+    return GetFrame(data_count_present_);
+  } else if (name == "sum_hess") {
+    return GetFrame(sum_hess_);
+  } else if (name == "sum_hess_present") {
+    return GetFrame(sum_hess_present_);
+  } else if (name == "gain") {
+    return GetFrame(gain_);
+  } else if (name == "gain_present") {
+    return GetFrame(gain_present_);
+  }
+  TREELITE_LOG(FATAL) << "Unknown field: " << name;
+  return PyBufferFrame{};
+}
+
+template PyBufferFrame Tree<float, float>::GetField(std::string const&);
+template PyBufferFrame Tree<double, double>::GetField(std::string const&);
+
+PyBufferFrame Model::GetTreeField(std::uint64_t tree_id, std::string const& name) {
+  return std::visit(
+      [&](auto&& model_preset) {
+        TREELITE_CHECK_LT(tree_id, model_preset.trees.size())
+            << "tree_id must be less than the number of trees (" << model_preset.trees.size()
+            << ")";
+        return model_preset.trees[tree_id].GetField(name);
+      },
+      variant_);
+}
+
+}  // namespace treelite
@@ -19,10 +19,25 @@
 #include <cstddef>
 #include <cstdint>
 #include <ostream>
+#include <string>
 #include <type_traits>
 
 namespace {
 
+/*! \brief RapidJSON output stream that appends to a std::string */
+class StringOutputStream {
+ public:
+  using Ch = char;
+  explicit StringOutputStream(std::string& str) : str_(str) {}
+  void Put(char c) {
+    str_.push_back(c);
+  }
+  void Flush() {}
+
+ private:
+  std::string& str_;
+};
+
 template <typename WriterType, typename T,
     typename std::enable_if<std::is_same_v<T, std::uint64_t>, bool>::type = true>
 void WriteElement(WriterType& writer, T e) {
@@ -222,4 +237,20 @@ void Model::DumpAsJSON(std::ostream& fo, bool pretty_print) const {
   }
 }
 
+std::string Model::DumpAsJSON(bool pretty_print) const {
+  // Write into the string directly, rather than into a std::ostringstream that would have to
+  // be copied out
+  std::string json_str;
+  StringOutputStream os(json_str);
+  if (pretty_print) {
+    rapidjson::PrettyWriter<StringOutputStream> writer(os);
+    writer.SetFormatOptions(rapidjson::PrettyFormatOptions::kFormatSingleLineArray);
+    DumpModelAsJSON(writer, *this);
+  } else {
+    rapidjson::Writer<StringOutputStream> writer(os);
+    DumpModelAsJSON(writer, *this);
+  }
+  return json_str;
+}
+
 }  // namespace treelite
@@ -0,0 +1,145 @@
+/*!
+ * Copyright (c) 2023 by Contributors
+ * \file mapped_file.h
+ * \brief Read-only view of the content of a file, backed by a memory mapping when available
+ * \author Hyunsu Cho
+ */
+
+#ifndef SRC_MODEL_LOADER_DETAIL_MAPPED_FILE_H_
+#define SRC_MODEL_LOADER_DETAIL_MAPPED_FILE_H_
+
+#include <treelite/detail/file_utils.h>
+#include <treelite/logging.h>
+
+#include <cerrno>
+#include <cstddef>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iterator>
+#include <string>
+#include <vector>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define TREELITE_USE_MMAP 1
+#else
+#define TREELITE_USE_MMAP 0
+#endif
+
+namespace treelite::model_loader::detail {
+
+/*!
+ * \brief Read-only view of the entire content of a file. On POSIX systems, the file is mapped
+ *        into memory, so that the parser can read directly from the page cache without an
+ *        intermediate copy. On other systems, and for paths that are not regular files (pipes,
+ *        character devices), the content is read into a buffer instead.
+ */
+class MappedFile {
+ public:
+  /*!
+   * \brief Open and map a file
+   * \param filename Name of the file
+   * \param prefetch Whether to fault in all pages of the file up front (MAP_POPULATE), so that
+   *                 the file is read with large sequential I/O instead of page by page
+   */
+  MappedFile(std::string const& filename, bool prefetch) {
+    // Not canonicalized: /dev/stdin resolves to a pipe that has no path of its own
+    auto path = std::filesystem::u8path(filename);
+    TREELITE_CHECK(std::filesystem::exists(path)) << "Path " << filename << " does not exist";
+#if TREELITE_USE_MMAP
+    struct stat st;
+    if (::stat(path.c_str(), &st) == 0 && !S_ISREG(st.st_mode)) {
+      // Pipes and character devices report a size of 0 and cannot be mapped; read them until EOF.
+      // Check before opening, since closing and re-opening a FIFO would lose its content.
+      TREELITE_CHECK(!S_ISDIR(st.st_mode)) << "Path " << filename << " is a directory";
+      ReadIntoBuffer(path);
+      return;
+    }
+    int fd = ::open(path.c_str(), O_RDONLY);
+    TREELITE_CHECK_NE(fd, -1) << "Could not open file " << filename << ": "
+                              << std::strerror(errno);
+    if (::fstat(fd, &st) != 0) {
+      int const err = errno;
+      ::close(fd);
+      TREELITE_LOG(FATAL) << "Could not stat file " << filename << ": " << std::strerror(err);
+    }
+    size_ = static_cast<std::size_t>(st.st_size);
+    if (size_ > 0) {
+      int flags = MAP_PRIVATE;
+#ifdef MAP_POPULATE
+      if (prefetch) {
+        flags |= MAP_POPULATE;
+      }
+#endif
+      void* addr = ::mmap(nullptr, size_, PROT_READ, flags, fd, 0);
+      int const err = errno;
+      ::close(fd);  // The mapping remains valid after the descriptor is closed
+      TREELITE_CHECK(addr != MAP_FAILED)
+          << "Could not map file " << filename << " into memory: " << std::strerror(err);
+      // Advisory only; failures are harmless
+      ::madvise(addr, size_, MADV_SEQUENTIAL);
+      if (prefetch) {
+        ::madvise(addr, size_, MADV_WILLNEED);
+      }
+      data_ = static_cast<char const*>(addr);
+      mapped_ = true;
+    } else {
+      ::close(fd);
+    }
+#else
+    (void)prefetch;
+    std::ifstream ifs = treelite::detail::OpenFileForReadAsStream(path);
+    buffer_.resize(static_cast<std::size_t>(std::filesystem::file_size(path)));
+    ifs.read(buffer_.data(), static_cast<std::streamsize>(buffer_.size()));
+    size_ = buffer_.size();
+    data_ = buffer_.data();
+#endif
+  }
+
+  ~MappedFile() {
+#if TREELITE_USE_MMAP
+    if (mapped_) {
+      ::munmap(const_cast<char*>(data_), size_);
+    }
+#endif
+  }
+
+  MappedFile(MappedFile const&) = delete;
+  MappedFile& operator=(MappedFile const&) = delete;
+
+  /*! \brief Pointer to the beginning of the file content. Not null-terminated. */
+  char const* data() const {
+    return data_;
+  }
+  /*! \brief Size of the file, in bytes */
+  std::size_t size() const {
+    return size_;
+  }
+
+ private:
+  /*! \brief Read a stream of unknown length (pipe, character device) until EOF */
+  void ReadIntoBuffer(std::filesystem::path const& path) {
+    std::ifstream ifs(path, std::ios::in | std::ios::binary);
+    TREELITE_CHECK(ifs) << "Could not open file " << path;
+    buffer_.assign(std::istreambuf_iterator<char>(ifs), std::istreambuf_iterator<char>());
+    size_ = buffer_.size();
+    if (size_ > 0) {
+      data_ = buffer_.data();
+    }
+  }
+
+  char const* data_{""};
+  std::size_t size_{0};
+  bool mapped_{false};
+  std::vector<char> buffer_;
+};
+
+}  // namespace treelite::model_loader::detail
+
+#undef TREELITE_USE_MMAP
+
+#endif  // SRC_MODEL_LOADER_DETAIL_MAPPED_FILE_H_
@@ -12,6 +12,7 @@
 #include <memory>
 #include <stack>
 #include <string>
+#include <unordered_set>
 #include <vector>
 
 #ifndef SRC_MODEL_LOADER_DETAIL_XGBOOST_JSON_H_
@@ -29,6 +30,12 @@ class Delegator {
   virtual void push_delegate(std::shared_ptr<BaseHandler> new_delegate) = 0;
   /*! \brief Get configuration for handlers */
   virtual rapidjson::Document const& get_handler_config() = 0;
+  /*!
+   * \brief Record an unknown key encountered during parsing
+   * \param key The unknown key
+   * \return Whether the key is seen for the first time
+   */
+  virtual bool register_unknown_key(std::string const& key) = 0;
 };
 
 class IgnoreHandler;
@@ -569,6 +576,9 @@ class DelegatedHandler :
   rapidjson::Document const& get_handler_config() override {
     return handler_config_;
   }
+  bool register_unknown_key(std::string const& key) override {
+    return unknown_keys_.insert(key).second;
+  }
   ParsedXGBoostModel get_result();
   bool Null();
   bool Bool(bool b);
@@ -594,6 +604,7 @@ class DelegatedHandler :
   std::stack<std::shared_ptr<BaseHandler>> delegates;
   ParsedXGBoostModel result;
   rapidjson::Document const& handler_config_;
+  std::unordered_set<std::string> unknown_keys_;
 };
 
 }  // namespace treelite::model_loader::detail
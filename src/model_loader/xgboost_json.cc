@@ -9,8 +9,7 @@
 
 #include <rapidjson/document.h>
 #include <rapidjson/error/en.h>
-#include <rapidjson/filereadstream.h>
-#include <treelite/detail/file_utils.h>
+#include <rapidjson/memorystream.h>
 #include <treelite/logging.h>
 #include <treelite/model_loader.h>
 #include <treelite/tree.h>
@@ -28,11 +27,15 @@
 #include <utility>
 #include <variant>
 
+#include "detail/mapped_file.h"
 #include "detail/string_utils.h"
 #include "detail/xgboost.h"
 
 namespace {
 
+rapidjson::Document ParseConfig(char const* config_json);
+std::unique_ptr<treelite::Model> ParseBuffer(
+    char const* json_str, std::size_t length, rapidjson::Document const& config);
 template <typename StreamType, typename ErrorHandlerFunc>
 std::unique_ptr<treelite::Model> ParseStream(std::unique_ptr<StreamType> input_stream,
     ErrorHandlerFunc error_handler, rapidjson::Document const& config);
@@ -45,69 +48,25 @@ namespace treelite::model_loader {
 
 std::unique_ptr<treelite::Model> LoadXGBoostModel(
     std::string const& filename, char const* config_json) {
-  char read_buffer[65536];
-
-  FILE* fp = treelite::detail::OpenFileForReadAsFilePtr(filename);
-
-  auto input_stream
-      = std::make_unique<rapidjson::FileReadStream>(fp, read_buffer, sizeof(read_buffer));
-  auto error_handler = [fp](std::size_t offset) -> std::string {
-    std::size_t cur = (offset >= 50 ? (offset - 50) : 0);
-    std::fseek(fp, cur, SEEK_SET);
-    int c;
-    std::ostringstream oss, oss2;
-    for (int i = 0; i < 100; ++i) {
-      c = std::fgetc(fp);
-      if (c == EOF) {
-        break;
-      }
-      oss << static_cast<char>(c);
-      if (cur == offset) {
-        oss2 << "^";
-      } else {
-        oss2 << "~";
-      }
-      ++cur;
+  rapidjson::Document parsed_config = ParseConfig(config_json);
+  bool prefetch = false;
+  if (parsed_config.IsObject()) {
+    auto itr = parsed_config.FindMember("prefetch");
+    if (itr != parsed_config.MemberEnd() && itr->value.IsBool()) {
+      prefetch = itr->value.GetBool();
     }
-    std::fclose(fp);
-    return oss.str() + "\n" + oss2.str();
-  };
-  rapidjson::Document parsed_config;
-  parsed_config.Parse(config_json);
-  TREELITE_CHECK(!parsed_config.HasParseError())
-      << "Error when parsing JSON config: offset " << parsed_config.GetErrorOffset() << ", "
-      << rapidjson::GetParseError_En(parsed_config.GetParseError());
-  auto parsed_model = ParseStream(std::move(input_stream), error_handler, parsed_config);
-  std::fclose(fp);
-  return parsed_model;
+  }
+  // Parse directly from the mapped file content, to avoid copying it into a read buffer
+  detail::MappedFile file(filename, prefetch);
+  return ParseBuffer(file.data(), file.size(), parsed_config);
 }
 
 std::unique_ptr<treelite::Model> LoadXGBoostModelFromString(
     char const* json_str, std::size_t length, char const* config_json) {
-  auto input_stream = std::make_unique<rapidjson::MemoryStream>(json_str, length);
-  auto error_handler = [json_str](std::size_t offset) -> std::string {
-    std::size_t cur = (offset >= 50 ? (offset - 50) : 0);
-    std::ostringstream oss, oss2;
-    for (int i = 0; i < 100; ++i) {
-      if (!json_str[cur]) {
-        break;
-      }
-      oss << json_str[cur];
-      if (cur == offset) {
-        oss2 << "^";
-      } else {
-        oss2 << "~";
-      }
-      ++cur;
-    }
-    return oss.str() + "\n" + oss2.str();
-  };
-  rapidjson::Document parsed_config;
-  parsed_config.Parse(config_json);
-  TREELITE_CHECK(!parsed_config.HasParseError())
-      << "Error when parsing JSON config: offset " << parsed_config.GetErrorOffset() << ", "
-      << rapidjson::GetParseError_En(parsed_config.GetParseError());
-  return ParseStream(std::move(input_stream), error_handler, parsed_config);
+  rapidjson::Document parsed_config = ParseConfig(config_json);
+  TREELITE_CHECK(!parsed_config.IsObject() || !parsed_config.HasMember("prefetch"))
+      << "The \"prefetch\" option only applies when loading a model from a file";
+  return ParseBuffer(json_str, length, parsed_config);
 }
 
 namespace detail {
@@ -129,7 +88,12 @@ bool BaseHandler::set_cur_key(char const* str, std::size_t length) {
   if (is_recognized_key(str)) {
     cur_key = std::string{str, length};
   } else if (allow_unknown_field_) {
-    TREELITE_LOG(WARNING) << "Warning: Encountered unknown key \"" << str << "\"";
+    // Warn once per key; an unknown field may be repeated in every tree of the model, and each
+    // warning is a round trip to the Python interpreter.
+    auto parent = delegator.lock();
+    if (!parent || parent->register_unknown_key(std::string{str, length})) {
+      TREELITE_LOG(WARNING) << "Warning: Encountered unknown key \"" << str << "\"";
+    }
     cur_key = "";
     state_next_field_ignore_ = true;
   } else {
@@ -762,6 +726,39 @@ Iter BinarySearch(Iter begin, Iter end, T const& val) {
   }
 }
 
+rapidjson::Document ParseConfig(char const* config_json) {
+  rapidjson::Document parsed_config;
+  parsed_config.Parse(config_json);
+  TREELITE_CHECK(!parsed_config.HasParseError())
+      << "Error when parsing JSON config: offset " << parsed_config.GetErrorOffset() << ", "
+      << rapidjson::GetParseError_En(parsed_config.GetParseError());
+  return parsed_config;
+}
+
+std::unique_ptr<treelite::Model> ParseBuffer(
+    char const* json_str, std::size_t length, rapidjson::Document const& config) {
+  auto input_stream = std::make_unique<rapidjson::MemoryStream>(json_str, length);
+  auto error_handler = [json_str, length](std::size_t offset) -> std::string {
+    std::size_t cur = (offset >= 50 ? (offset - 50) : 0);
+    std::ostringstream oss, oss2;
+    // The buffer is not necessarily null-terminated, so stay within its bounds
+    for (int i = 0; i < 100 && cur < length; ++i) {
+      if (!json_str[cur]) {
+        break;
+      }
+      oss << json_str[cur];
+      if (cur == offset) {
+        oss2 << "^";
+      } else {
+        oss2 << "~";
+      }
+      ++cur;
+    }
+    return oss.str() + "\n" + oss2.str();
+  };
+  return ParseStream(std::move(input_stream), error_handler, config);
+}
+
 template <typename StreamType, typename ErrorHandlerFunc>
 std::unique_ptr<treelite::Model> ParseStream(std::unique_ptr<StreamType> input_stream,
     ErrorHandlerFunc error_handler, rapidjson::Document const& config) {
@@ -5,7 +5,6 @@
  * \author Hyunsu Cho
  */
 
-#include <treelite/detail/file_utils.h>
 #include <treelite/enum/operator.h>
 #include <treelite/enum/task_type.h>
 #include <treelite/enum/typeinfo.h>
@@ -19,12 +18,13 @@
 #include <cstdint>
 #include <cstring>
 #include <filesystem>
-#include <fstream>
+#include <istream>
 #include <memory>
 #include <queue>
-#include <sstream>
+#include <streambuf>
 #include <variant>
 
+#include "./detail/mapped_file.h"
 #include "./detail/xgboost.h"
 #include "detail/string_utils.h"
 
@@ -32,6 +32,15 @@ namespace fs = std::filesystem;
 
 namespace {
 
+/* read-only stream buffer over a memory region, so that it can be read without a copy */
+class MemoryStreamBuf : public std::streambuf {
+ public:
+  MemoryStreamBuf(char const* data, std::size_t size) {
+    char* begin = const_cast<char*>(data);  // The get area is never written to
+    setg(begin, begin, begin + size);
+  }
+};
+
 inline std::unique_ptr<treelite::Model> ParseStream(std::istream& fi);
 
 }  // anonymous namespace
@@ -39,12 +48,15 @@ inline std::unique_ptr<treelite::Model> ParseStream(std::istream& fi);
 namespace treelite::model_loader {
 
 std::unique_ptr<treelite::Model> LoadXGBoostModelLegacyBinary(std::string const& filename) {
-  std::ifstream fi = treelite::detail::OpenFileForReadAsStream(filename);
-  return ParseStream(fi);
+  // The model is read with many small reads, so read it from a memory mapping rather than
+  // through a file stream with a small buffer.
+  detail::MappedFile file(filename, false);
+  return LoadXGBoostModelLegacyBinary(file.data(), file.size());
 }
 
 std::unique_ptr<treelite::Model> LoadXGBoostModelLegacyBinary(void const* buf, std::size_t len) {
-  std::istringstream fi(std::string(static_cast<char const*>(buf), len));
+  MemoryStreamBuf streambuf(static_cast<char const*>(buf), len);
+  std::istream fi(&streambuf);
   return ParseStream(fi);
 }
 
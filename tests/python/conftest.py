@@ -0,0 +1,59 @@
+"""Pytest configuration for the Python tests
+
+The tests can be spread over several processes with pytest-xdist:
+
+    pytest -n auto tests/python
+
+Set HYPOTHESIS_DB to the path of a directory to store the Hypothesis example database
+there, e.g. a directory that CI caches between runs.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import warnings
+
+import pytest
+
+# Modules that may load an OpenMP runtime or a threaded BLAS when imported
+_THREADED_MODULES = ("numpy", "sklearn", "xgboost", "lightgbm", "treelite")
+
+
+def _limit_threads_in_xdist_worker():
+    """
+    Split the cores evenly among pytest-xdist workers, so that they don't oversubscribe
+    the cores. Every worker runs OpenMP-parallel code (Treelite, scikit-learn, XGBoost).
+    LOKY_MAX_CPU_COUNT caps the number of jobs that joblib uses for n_jobs=-1 in
+    scikit-learn.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return
+    # The thread counts are read once, when the runtimes are loaded
+    loaded = [name for name in _THREADED_MODULES if name in sys.modules]
+    if loaded:
+        warnings.warn(
+            f"{', '.join(loaded)} already imported; OMP_NUM_THREADS may not take effect"
+        )
+    n_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    nthread = str(max(1, (os.cpu_count() or 1) // n_workers))
+    os.environ.setdefault("OMP_NUM_THREADS", nthread)
+    os.environ.setdefault("LOKY_MAX_CPU_COUNT", nthread)
+
+
+# Run at import time: conftest.py is imported before any test module, and thus before
+# the test modules import NumPy, scikit-learn or XGBoost
+_limit_threads_in_xdist_worker()
+
+
+@pytest.fixture(scope="session")
+def shared_tmpdir(tmp_path_factory):
+    """
+    Temporary directory shared by all tests of the session. Use util.unique_files() to
+    create files in it. Honors the PYTEST_TMPDIR environment variable.
+    """
+    if "PYTEST_TMPDIR" not in os.environ:
+        yield tmp_path_factory.mktemp("treelite")
+        return
+    tmpdir = tempfile.mkdtemp(dir=os.environ["PYTEST_TMPDIR"])
+    yield tmpdir
+    shutil.rmtree(tmpdir, ignore_errors=True)
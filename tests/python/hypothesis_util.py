@@ -1,9 +1,11 @@
 """Utility functions for hypothesis-based testing"""
+import os
 from math import ceil
 from sys import platform as _platform
 
 import numpy as np
 from hypothesis import assume
+from hypothesis.database import DirectoryBasedExampleDatabase
 from hypothesis.strategies import composite, integers, just, none
 from sklearn.datasets import (
     make_classification,
@@ -329,4 +331,8 @@ def standard_settings():
         "max_examples": 100,
         "print_blob": True,
     }
+    # Allow CI to keep the example database in a directory that is cached between runs,
+    # so that examples saved by an earlier run are replayed in the reuse phase
+    if "HYPOTHESIS_DB" in os.environ:
+        kwargs["database"] = DirectoryBasedExampleDatabase(os.environ["HYPOTHESIS_DB"])
     return kwargs
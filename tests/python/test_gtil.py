@@ -51,12 +51,12 @@ def test_predict_special_with_regressor(predict_kind, dataset, num_boost_round):
     if predict_kind == "leaf_id":
         leaf_pred = treelite.gtil.predict_leaf(model, X)
         assert leaf_pred.shape == (X.shape[0], num_boost_round)
-        xgb_leaf_pred = xgb_model.predict(xgb.DMatrix(X), pred_leaf=True)
+        xgb_leaf_pred = xgb_model.predict(dtrain, pred_leaf=True)
         assert np.array_equal(leaf_pred, xgb_leaf_pred)
     else:
         pred_per_tree = treelite.gtil.predict_per_tree(model, X)
         assert pred_per_tree.shape == (X.shape[0], num_boost_round, 1)
-        pred = xgb_model.predict(xgb.DMatrix(X), output_margin=True)
+        pred = xgb_model.predict(dtrain, output_margin=True)
         np.testing.assert_almost_equal(
             np.sum(pred_per_tree, axis=1).flatten(), pred, decimal=3
         )
@@ -91,12 +91,12 @@ def test_predict_special_with_binary_classifier(predict_kind, dataset, num_boost
     if predict_kind == "leaf_id":
         leaf_pred = treelite.gtil.predict_leaf(model, X)
         assert leaf_pred.shape == (X.shape[0], num_boost_round)
-        xgb_leaf_pred = xgb_model.predict(xgb.DMatrix(X), pred_leaf=True)
+        xgb_leaf_pred = xgb_model.predict(dtrain, pred_leaf=True)
         assert np.array_equal(leaf_pred, xgb_leaf_pred)
     else:
         pred_per_tree = treelite.gtil.predict_per_tree(model, X)
         assert pred_per_tree.shape == (X.shape[0], num_boost_round, 1)
-        pred = xgb_model.predict(xgb.DMatrix(X), output_margin=True)
+        pred = xgb_model.predict(dtrain, output_margin=True)
         np.testing.assert_almost_equal(
             np.sum(pred_per_tree, axis=1).flatten(), pred, decimal=3
         )
@@ -155,5 +155,5 @@ def test_predict_special_with_multiclass_classifier_grove_per_class(
                 for class_id in range(num_class)
             )
         )
-        pred = xgb_model.predict(xgb.DMatrix(X_sample), output_margin=True)
+        pred = xgb_model.inplace_predict(X_sample, predict_type="margin")
         np.testing.assert_almost_equal(sum_by_class, pred, decimal=3)
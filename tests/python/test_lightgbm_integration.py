@@ -15,7 +15,7 @@ from .hypothesis_util import (
     standard_settings,
 )
 from .metadata import dataset_db
-from .util import TemporaryDirectory, load_txt, to_categorical
+from .util import load_txt, sparse_to_dense_with_nan, to_categorical, unique_files
 
 try:
     import lightgbm as lgb
@@ -45,8 +45,9 @@ def test_lightgbm_regression(
     dataset,
     use_categorical,
     callback,
+    shared_tmpdir,
 ):
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-arguments
     """Test LightGBM regressor"""
     X, y = dataset
     if use_categorical:
@@ -77,8 +78,8 @@ def test_lightgbm_regression(
     )
     expected_pred = lgb_model.predict(X_pred).reshape((-1, 1))
 
-    with TemporaryDirectory() as tmpdir:
-        lgb_model_path = pathlib.Path(tmpdir) / "lightgbm_model.txt"
+    with unique_files(shared_tmpdir) as make_path:
+        lgb_model_path = make_path("lightgbm_model.txt")
         lgb_model.save_model(lgb_model_path)
 
         tl_model = treelite.frontend.load_lightgbm_model(lgb_model_path)
@@ -100,8 +101,9 @@ def test_lightgbm_binary_classification(
     num_boost_round,
     use_categorical,
     callback,
+    shared_tmpdir,
 ):
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-arguments
     """Test LightGBM binary classifier"""
     X, y = dataset
     if use_categorical:
@@ -131,8 +133,8 @@ def test_lightgbm_binary_classification(
     )
     expected_prob = lgb_model.predict(X_pred).reshape((-1, 1))
 
-    with TemporaryDirectory() as tmpdir:
-        lgb_model_path = pathlib.Path(tmpdir) / "breast_cancer_lightgbm.txt"
+    with unique_files(shared_tmpdir) as make_path:
+        lgb_model_path = make_path("breast_cancer_lightgbm.txt")
         lgb_model.save_model(lgb_model_path)
 
         tl_model = treelite.frontend.load_lightgbm_model(lgb_model_path)
@@ -158,6 +160,7 @@ def test_lightgbm_multiclass_classification(
     num_boost_round,
     use_categorical,
     callback,
+    shared_tmpdir,
 ):
     # pylint: disable=too-many-locals,too-many-arguments
     """Test LightGBM multi-class classifier"""
@@ -192,8 +195,8 @@ def test_lightgbm_multiclass_classification(
     )
     expected_pred = lgb_model.predict(X_pred)
 
-    with TemporaryDirectory() as tmpdir:
-        lgb_model_path = pathlib.Path(tmpdir) / "iris_lightgbm.txt"
+    with unique_files(shared_tmpdir) as make_path:
+        lgb_model_path = make_path("iris_lightgbm.txt")
         lgb_model.save_model(lgb_model_path)
 
         tl_model = treelite.frontend.load_lightgbm_model(lgb_model_path)
@@ -242,8 +245,7 @@ def test_lightgbm_sparse_ranking_model(tmpdir):
     tl_model = treelite.frontend.load_lightgbm_model(lgb_model_path)
 
     # GTIL doesn't yet support sparse matrix; so use NaN to represent missing values
-    Xa = X.toarray()
-    Xa[Xa == 0] = "nan"
+    Xa = sparse_to_dense_with_nan(X)
     out = treelite.gtil.predict(tl_model, Xa)
 
     np.testing.assert_almost_equal(out, lgb_out)
@@ -260,7 +262,6 @@ def test_lightgbm_sparse_categorical_model():
     )
     expected_pred = load_txt(dataset_db[dataset].expected_margin).reshape((-1, 1))
     # GTIL doesn't yet support sparse matrix; so use NaN to represent missing values
-    Xa = X.toarray()
-    Xa[Xa == 0] = "nan"
+    Xa = sparse_to_dense_with_nan(X)
     out_pred = treelite.gtil.predict(tl_model, Xa, pred_margin=True)
     np.testing.assert_almost_equal(out_pred, expected_pred, decimal=5)
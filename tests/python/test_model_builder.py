@@ -137,3 +137,66 @@ def test_leaf_vector_rf(predict_kind):
         expected_pred = np.array([[2, 2], [1, 1]])
         pred = treelite.gtil.predict_leaf(model, dmat)
     np.testing.assert_almost_equal(pred, expected_pred, decimal=5)
+
+
+def test_get_tree_field():
+    """Test zero-copy access to the node arrays of a tree"""
+    builder = ModelBuilder(
+        threshold_type="float32",
+        leaf_output_type="float32",
+        metadata=Metadata(
+            num_feature=2,
+            task_type="kRegressor",
+            average_tree_output=False,
+            num_target=1,
+            num_class=[1],
+            leaf_vector_shape=[1, 1],
+        ),
+        tree_annotation=TreeAnnotation(num_tree=1, target_id=[0], class_id=[0]),
+        postprocessor=PostProcessorFunc(name="identity"),
+        base_scores=[0.0],
+    )
+    builder.start_tree()
+    builder.start_node(0)
+    builder.numerical_test(
+        feature_id=1,
+        threshold=0.5,
+        default_left=True,
+        opname="<",
+        left_child_key=1,
+        right_child_key=2,
+    )
+    builder.end_node()
+    builder.start_node(1)
+    builder.leaf(-1.0)
+    builder.end_node()
+    builder.start_node(2)
+    builder.leaf(1.0)
+    builder.end_node()
+    builder.end_tree()
+    model = builder.commit()
+
+    threshold = model.get_tree_field(0, "threshold")
+    assert threshold.dtype == np.float32
+    np.testing.assert_equal(threshold[:1], [0.5])
+    np.testing.assert_equal(model.get_tree_field(0, "cleft"), [1, -1, -1])
+    np.testing.assert_equal(model.get_tree_field(0, "cright"), [2, -1, -1])
+    np.testing.assert_equal(model.get_tree_field(0, "split_index")[:1], [1])
+    default_left = model.get_tree_field(0, "default_left")
+    assert default_left.dtype == np.bool_
+    assert default_left[0]
+    np.testing.assert_equal(model.get_tree_field(0, "leaf_value")[1:], [-1.0, 1.0])
+    with pytest.raises(ValueError):
+        threshold[0] = 0.0
+    # The tree has no categorical split, so the field is empty, but still read-only
+    category_list = model.get_tree_field(0, "category_list")
+    assert category_list.shape == (0,)
+    assert not category_list.flags.writeable
+    with pytest.raises(TreeliteError):
+        model.get_tree_field(0, "foobar")
+    with pytest.raises(TreeliteError):
+        model.get_tree_field(1, "threshold")
+
+    # The view keeps the model alive
+    del model
+    np.testing.assert_equal(threshold[:1], [0.5])
@@ -58,7 +58,7 @@ def test_model_concat_with_tree_stump():
     ref_tree_stump = make_tree_stump()
     ref_tree_stump_json = json.loads(ref_tree_stump.dump_as_json(pretty_print=False))
     concatenated_model_json = json.loads(
-        concatenated_model.dump_as_json(pretty_print=False)
+        concatenated_model.dump_as_json_bytes(pretty_print=False)
     )
     for attr in [
         "num_feature",
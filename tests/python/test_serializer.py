@@ -1,5 +1,4 @@
 """Test for serializer"""
-import pathlib
 
 import numpy as np
 import pytest
@@ -13,7 +12,7 @@ from .hypothesis_util import (
     standard_regression_datasets,
     standard_settings,
 )
-from .util import TemporaryDirectory
+from .util import unique_files
 
 try:
     from sklearn.dummy import DummyClassifier, DummyRegressor
@@ -53,7 +52,7 @@ def test_serialize_as_bytes(clazz, dataset, n_estimators, max_depth, callback):
     """Test whether Treelite objects can be serialized to a byte sequence"""
     # pylint: disable=too-many-locals
     X, y = dataset
-    n_classes = len(np.unique(y))
+    n_classes = int(np.max(y)) + 1
     kwargs = {"max_depth": max_depth, "random_state": 0}
     if clazz == HistGradientBoostingClassifier:
         kwargs["max_iter"] = n_estimators
@@ -103,7 +102,9 @@ def test_serialize_as_bytes(clazz, dataset, n_estimators, max_depth, callback):
     callback=hypothesis_callback(),
 )
 @settings(**standard_settings())
-def test_serialize_as_checkpoint(clazz, n_estimators, max_depth, callback):
+def test_serialize_as_checkpoint(
+    clazz, n_estimators, max_depth, callback, shared_tmpdir
+):
     """Test whether Treelite objects can be serialized to a checkpoint"""
     # pylint: disable=too-many-locals
     if clazz in [RandomForestRegressor, ExtraTreesRegressor]:
@@ -127,21 +128,21 @@ def test_serialize_as_checkpoint(clazz, n_estimators, max_depth, callback):
     clf = clazz(**kwargs)
     clf.fit(X, y)
     if n_targets > 1:
-        expected_pred = np.transpose(clf.predict(X)[:, :, np.newaxis], axes=(1, 0, 2))
+        expected_pred = np.ascontiguousarray(clf.predict(X).T)[:, :, np.newaxis]
     else:
         expected_pred = clf.predict(X).reshape((X.shape[0], -1))
 
-    with TemporaryDirectory() as tmpdir:
+    with unique_files(shared_tmpdir) as make_path:
         # Prediction should be correct after a round-trip
         tl_model = treelite.sklearn.import_model(clf)
-        checkpoint_path = pathlib.Path(tmpdir) / "checkpoint.bin"
+        checkpoint_path = make_path("checkpoint.bin")
         tl_model.serialize(checkpoint_path)
         tl_model2 = treelite.Model.deserialize(checkpoint_path)
         out_pred = treelite.gtil.predict(tl_model2, X)
         np.testing.assert_almost_equal(out_pred, expected_pred, decimal=3)
 
         # The model should serialize to the same byte sequence after a round-trip
-        checkpoint_path2 = pathlib.Path(tmpdir) / "checkpoint2.bin"
+        checkpoint_path2 = make_path("checkpoint2.bin")
         tl_model2.serialize(checkpoint_path2)
         with open(checkpoint_path, "rb") as f, open(checkpoint_path2, "rb") as f2:
             checkpoint = f.read()
@@ -1,9 +1,10 @@
 """Tests for scikit-learn integration"""
+
 import numpy as np
 import pandas as pd
 import pytest
 import treelite
-from hypothesis import given, settings
+from hypothesis import Phase, given, settings
 from hypothesis.strategies import data as hypothesis_callback
 from hypothesis.strategies import floats, integers, just, sampled_from
 from sklearn.dummy import DummyClassifier, DummyRegressor
@@ -33,6 +34,13 @@ except ImportError:
 
 pytestmark = pytest.mark.skipif(not has_pandas(), reason="Pandas required")
 
+# Settings for tests that fit an estimator in every example. Shrinking is skipped, since
+# each shrink step refits an estimator; a failing example is still reported as drawn.
+_HEAVY_SETTINGS = {
+    **standard_settings(),
+    "phases": (Phase.explicit, Phase.reuse, Phase.generate, Phase.target),
+}
+
 
 @given(
     clazz=sampled_from(
@@ -46,7 +54,7 @@ pytestmark = pytest.mark.skipif(not has_pandas(), reason="Pandas required")
     n_estimators=integers(min_value=5, max_value=10),
     callback=hypothesis_callback(),
 )
-@settings(**standard_settings())
+@settings(**_HEAVY_SETTINGS)
 def test_skl_regressor(clazz, n_estimators, callback):
     """Scikit-learn regressor"""
     if clazz in [RandomForestRegressor, ExtraTreesRegressor]:
@@ -73,7 +81,7 @@ def test_skl_regressor(clazz, n_estimators, callback):
     tl_model = treelite.sklearn.import_model(clf)
     out_pred = treelite.gtil.predict(tl_model, X)
     if n_targets > 1:
-        expected_pred = np.transpose(clf.predict(X)[:, :, np.newaxis], axes=(1, 0, 2))
+        expected_pred = np.ascontiguousarray(clf.predict(X).T)[:, :, np.newaxis]
     else:
         expected_pred = clf.predict(X).reshape((X.shape[0], -1))
     np.testing.assert_almost_equal(out_pred, expected_pred, decimal=3)
@@ -94,11 +102,11 @@ def test_skl_regressor(clazz, n_estimators, callback):
     n_estimators=integers(min_value=3, max_value=10),
     callback=hypothesis_callback(),
 )
-@settings(**standard_settings())
+@settings(**_HEAVY_SETTINGS)
 def test_skl_classifier(clazz, dataset, n_estimators, callback):
     """Scikit-learn binary classifier"""
     X, y = dataset
-    n_classes = len(np.unique(y))
+    n_classes = int(np.max(y)) + 1
     kwargs = {"max_depth": 3, "random_state": 0}
     if clazz == HistGradientBoostingClassifier:
         kwargs["max_iter"] = n_estimators
@@ -154,7 +162,7 @@ def test_skl_converter_iforest(dataset):
     use_categorical=sampled_from([True, False]),
     callback=hypothesis_callback(),
 )
-@settings(**standard_settings())
+@settings(**_HEAVY_SETTINGS)
 def test_skl_hist_gradient_boosting_with_categorical(
     dataset, num_boost_round, use_categorical, callback
 ):
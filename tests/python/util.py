@@ -1,10 +1,12 @@
 """Utility functions for tests"""
-import os
-import tempfile
+import collections
+import hashlib
+import pathlib
+import uuid
 from contextlib import contextmanager
 from math import ceil
 from sys import platform as _platform
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
 
@@ -20,6 +22,50 @@ def load_txt(filename):
     return np.array(content, dtype=np.float32)
 
 
+def array_digest(array):
+    """Compute a short digest of a NumPy array, including its shape and data type"""
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(array.tobytes(), digest_size=16).digest()
+    return array.shape, array.dtype.str, digest
+
+
+def _cache_key_part(value):
+    """Convert an argument into a hashable part of a cache key"""
+    if isinstance(value, np.ndarray):
+        return array_digest(value)
+    if isinstance(value, dict):
+        # Hyperparameters may hold unhashable values, e.g. estimators
+        return tuple(sorted((k, repr(v)) for k, v in value.items()))
+    return value
+
+
+# A single lookup method is the whole interface of a cache
+class DigestLRUCache:  # pylint: disable=too-few-public-methods
+    """
+    Least-recently-used cache for models fitted from NumPy arrays. Hypothesis replays
+    examples when shrinking a failure, and fitting dominates the cost of each example,
+    so caching the fitted models skips most of the work of a replay. NumPy arrays in the
+    key are identified by array_digest(), and dicts (hyperparameters) by the repr() of
+    their items. Cached models are shared, so callers must not modify them.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+
+    def get_or_compute(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Look up the value cached for key, calling compute() to produce it on a miss"""
+        key = tuple(_cache_key_part(x) for x in key)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+
 def has_pandas():
     """Check whether pandas is available"""
     try:
@@ -116,21 +162,43 @@ def to_categorical(
     return generated_df, generated_array
 
 
-@contextmanager
-def TemporaryDirectory(*args, **kwargs):
+def sparse_to_dense_with_nan(X, dtype=np.float64):
     # pylint: disable=C0103
     """
-    Simulate the effect of 'ignore_cleanup_errors' parameter of tempfile.TemporaryDirectory.
-    The parameter is only available for Python >= 3.10.
+    Convert a SciPy CSR matrix into a dense NumPy array, representing missing values
+    (implicit and explicit zeros) with NaN. GTIL does not yet support sparse matrices.
+    Only the nonzero entries are copied; no intermediate dense array is allocated.
     """
-    if "PYTEST_TMPDIR" in os.environ and "dir" not in kwargs:
-        kwargs["dir"] = os.environ["PYTEST_TMPDIR"]
-    tmpdir = tempfile.TemporaryDirectory(*args, **kwargs)
+    out = np.full(X.shape, np.nan, dtype=dtype)
+    row_ind = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+    mask = X.data != 0
+    out[row_ind[mask], X.indices[mask]] = X.data[mask]
+    return out
+
+
+@contextmanager
+def unique_files(directory):
+    """
+    Generate unique file names inside a directory shared by many tests, and delete the
+    files on exit. This is cheaper than creating and removing a temporary directory for
+    every example of a Hypothesis test. Yields a function that maps a file name (e.g.
+    "model.json") to a unique path with the same suffix.
+    """
+    prefix = uuid.uuid4().hex
+    paths = []
+
+    def make_path(name):
+        path = pathlib.Path(directory) / f"{prefix}_{name}"
+        paths.append(path)
+        return path
+
     try:
-        yield tmpdir.name
+        yield make_path
     finally:
-        try:
-            tmpdir.cleanup()
-        except (PermissionError, NotADirectoryError):
-            if _platform != "win32":
-                raise
+        for path in paths:
+            try:
+                path.unlink(missing_ok=True)
+            except PermissionError:
+                # On Windows, a file cannot be removed while it is open
+                if _platform != "win32":
+                    raise